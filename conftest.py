@@ -7,13 +7,12 @@ from django.test.client import Client
 from haystack import connections as haystack_connections
 from pytest_django.lazy_django import skip_if_no_django
 
+from course_discovery.apps.api.tests.mixins import TEST_DOMAIN
 from course_discovery.apps.core.tests.factories import PartnerFactory, SiteFactory
 from course_discovery.apps.core.utils import ElasticsearchUtils
 
 logger = logging.getLogger(__name__)
 
-TEST_DOMAIN = 'testserver.fake'
-
 
 @pytest.fixture(scope='session', autouse=True)
 def django_cache_add_xdist_key_prefix(request):
@@ -9,6 +9,7 @@ from drf_haystack.filters import HaystackFacetFilter
 from drf_haystack.query import FacetQueryBuilder
 from dry_rest_permissions.generics import DRYPermissionFiltersBase
 from guardian.shortcuts import get_objects_for_user
+from haystack import connections as haystack_connections
 from rest_framework.exceptions import NotFound, PermissionDenied
 
 from course_discovery.apps.api.utils import cast2int
@@ -79,9 +80,23 @@ class HaystackRequestFilterMixin:
             if not filters[key]:
                 del filters[key]
 
+        # A content type filter covering every indexed content type matches all documents. Drop it, rather than
+        # sending Elasticsearch a clause that filters nothing out.
+        content_types = {
+            content_type.strip() for value in filters.getlist('content_type') for content_type in value.split(',')
+        }
+        if content_types and content_types >= get_indexed_content_types():
+            del filters['content_type']
+
         return filters
 
 
+def get_indexed_content_types():
+    """ Returns the content types of all indexed models, as stored in the content_type index field. """
+    unified_index = haystack_connections['default'].get_unified_index()
+    return {model.__name__.lower() for model in unified_index.get_indexed_models()}
+
+
 class HaystackFacetFilterWithQueries(HaystackRequestFilterMixin, HaystackFacetFilter):
     query_builder_class = FacetQueryBuilderWithQueries
 
@@ -1623,6 +1623,12 @@ class CourseSearchModelSerializer(HaystackSerializerMixin, ContentTypeSerializer
 
 
 class CourseRunSearchModelSerializer(HaystackSerializerMixin, ContentTypeSerializer, CourseRunWithProgramsSerializer):
+    @classmethod
+    def prefetch_queryset(cls, queryset=None):
+        queryset = super().prefetch_queryset(queryset=queryset)
+
+        return queryset.prefetch_related('course__programs__type', 'course__programs__courses')
+
     class Meta(CourseRunWithProgramsSerializer.Meta):
         fields = ContentTypeSerializer.Meta.fields + CourseRunWithProgramsSerializer.Meta.fields
 
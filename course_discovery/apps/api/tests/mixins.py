@@ -4,15 +4,34 @@ from django.test import RequestFactory
 
 from course_discovery.apps.core.tests.factories import PartnerFactory, SiteFactory
 
+TEST_DOMAIN = 'testserver.fake'
+
 
 class SiteMixin(object):
+    # Set by create_site_and_partner, so setUp knows the class already has its site and partner.
+    site_and_partner_created = False
+
+    @classmethod
+    def create_site_and_partner(cls):
+        """
+        Create the test site and partner once for the whole class.
+
+        Call this from ``setUpTestData`` when class-level fixtures need a partner; ``setUp`` will then
+        reuse these objects instead of creating new ones for every test.
+        """
+        Site.objects.all().delete()
+        cls.site = SiteFactory(id=settings.SITE_ID, domain=TEST_DOMAIN)
+        cls.partner = PartnerFactory(site=cls.site)
+        cls.site_and_partner_created = True
+
     def setUp(self):
         super(SiteMixin, self).setUp()
-        domain = 'testserver.fake'
-        self.client = self.client_class(SERVER_NAME=domain)
-        Site.objects.all().delete()
-        self.site = SiteFactory(id=settings.SITE_ID, domain=domain)
-        self.partner = PartnerFactory(site=self.site)
+        self.client = self.client_class(SERVER_NAME=TEST_DOMAIN)
+
+        if not self.site_and_partner_created:
+            Site.objects.all().delete()
+            self.site = SiteFactory(id=settings.SITE_ID, domain=TEST_DOMAIN)
+            self.partner = PartnerFactory(site=self.site)
 
         self.request = RequestFactory(SERVER_NAME=self.site.domain).get('')
         self.request.site = self.site
@@ -1,7 +1,7 @@
 from rest_framework.test import APIRequestFactory
 from rest_framework.views import APIView
 
-from course_discovery.apps.api.filters import HaystackRequestFilterMixin
+from course_discovery.apps.api.filters import HaystackRequestFilterMixin, get_indexed_content_types
 
 
 class TestHaystackRequestFilterMixin:
@@ -27,3 +27,18 @@ class TestHaystackRequestFilterMixin:
         filters = HaystackRequestFilterMixin.get_request_filters(request)
         assert 'q' not in filters
         assert filters.get('test') == '0'
+
+    def test_get_request_filters_with_all_content_types(self):
+        """ Verify the method drops a content type filter that covers every indexed content type. """
+        content_types = sorted(get_indexed_content_types())
+        query = '&'.join('content_type={}'.format(content_type) for content_type in content_types)
+        request = APIRequestFactory().get('/?q=test&' + query)
+        request = APIView().initialize_request(request)
+        filters = HaystackRequestFilterMixin.get_request_filters(request)
+        assert 'content_type' not in filters
+        assert filters.get('q') == 'test'
+
+        request = APIRequestFactory().get('/?content_type=' + ','.join(content_types))
+        request = APIView().initialize_request(request)
+        filters = HaystackRequestFilterMixin.get_request_filters(request)
+        assert 'content_type' not in filters
@@ -210,3 +210,15 @@ class APITestCase(SiteMixin, RestAPITestCase):
         while still ensuring that we don't inflate the number of queries by an order of magnitude.
         """
         return super(APITestCase, self).assertNumQueries(FuzzyInt(expected, threshold))
+
+    def assert_dict_contains_subset(self, expected, actual):
+        """
+        Asserts that every key in expected is present in actual with an equal value.
+
+        This replaces the deprecated assertDictContainsSubset, and reports mismatches as a regular dict diff.
+        """
+        self.assertEqual(actual, {**actual, **expected})
+
+    def _get(self, path, **params):
+        """ Issues a GET request for path, passing the given params as its query string. """
+        return self.client.get(path, data=params)
@@ -1,95 +1,94 @@
-import urllib
+import uuid
 
+import mock
 from rest_framework.reverse import reverse
 
 from course_discovery.apps.api.v1.tests.test_views.mixins import APITestCase
 from course_discovery.apps.core.tests.factories import UserFactory
+from course_discovery.apps.course_metadata.models import Course, CourseRun
 from course_discovery.apps.course_metadata.tests.factories import CourseFactory, CourseRunFactory
 
 
-class CatalogQueryViewSetTests(APITestCase):
+class CatalogQueryContainsTestCase(APITestCase):
+    """ Base class which creates the site, partner and authenticated superuser once per test class. """
+    url_base = reverse('api:v1:catalog-query_contains')
+
+    @classmethod
+    def setUpTestData(cls):
+        super(CatalogQueryContainsTestCase, cls).setUpTestData()
+        cls.create_site_and_partner()
+        cls.user = UserFactory(is_staff=True, is_superuser=True)
+
     def setUp(self):
-        super(CatalogQueryViewSetTests, self).setUp()
-        self.user = UserFactory(is_staff=True, is_superuser=True)
+        super(CatalogQueryContainsTestCase, self).setUp()
         self.client.force_authenticate(self.user)
-        self.course = CourseFactory(partner=self.partner, key='simple_key')
-        self.course_run = CourseRunFactory(course=self.course)
-        self.url_base = reverse('api:v1:catalog-query_contains')
-        self.error_message = 'CatalogQueryContains endpoint requires query and identifiers list(s)'
+        self.client.defaults['HTTP_ACCEPT'] = 'application/json'
 
-    def test_contains_single_course_run(self):
-        """ Verify that a single course_run is contained in a query. """
-        qs = urllib.parse.urlencode({
-            'query': 'id:' + self.course_run.key,
-            'course_run_ids': self.course_run.key,
-            'course_uuids': self.course.uuid,
-        })
-        url = '{}/?{}'.format(self.url_base, qs)
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(
-            response.data,
-            {
-                self.course_run.key: True,
-                str(self.course.uuid): False
-            }
-        )
 
-    def test_contains_single_course(self):
-        """ Verify that a single course is contained in a query. """
-        qs = urllib.parse.urlencode({
-            'query': 'key:' + self.course.key,
-            'course_run_ids': self.course_run.key,
-            'course_uuids': self.course.uuid,
-        })
-        url = '{}/?{}'.format(self.url_base, qs)
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(
-            response.data,
-            {
-                self.course_run.key: False,
-                str(self.course.uuid): True
-            }
-        )
+class CatalogQueryViewSetTests(CatalogQueryContainsTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super(CatalogQueryViewSetTests, cls).setUpTestData()
+        cls.course = CourseFactory(partner=cls.partner, key='simple_key')
+        cls.course_run = CourseRunFactory(course=cls.course)
+        cls.course_uuid = str(cls.course.uuid)
+        cls.identifiers = {
+            'course_run_ids': cls.course_run.key,
+            'course_uuids': cls.course_uuid,
+        }
 
-    def test_contains_course_and_run(self):
-        """ Verify that both the course and the run are contained in the broadest query. """
-        self.course.course_runs.add(self.course_run)
-        self.course.save()
-        qs = urllib.parse.urlencode({
-            'query': 'org:*',
-            'course_run_ids': self.course_run.key,
-            'course_uuids': self.course.uuid,
-        })
-        url = '{}/?{}'.format(self.url_base, qs)
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(
-            response.data,
-            {
-                self.course_run.key: True,
-                str(self.course.uuid): True
-            }
-        )
+    def test_contains(self):
+        """ Verify that the course and run are reported as contained only when they match the query. """
+        # Elasticsearch is mocked out: each case specifies which course run keys and course primary keys the
+        # search index would return, and the view is responsible for filtering those down to the request.
+        cases = [
+            ('id:' + self.course_run.key, [self.course_run.key], [],
+             {self.course_run.key: True, self.course_uuid: False}),
+            ('key:' + self.course.key, [], [self.course.pk],
+             {self.course_run.key: False, self.course_uuid: True}),
+            ('org:*', [self.course_run.key], [self.course.pk],
+             {self.course_run.key: True, self.course_uuid: True}),
+        ]
+        for query, course_run_keys, course_pks, expected in cases:
+            with self.subTest(query=query), \
+                    mock.patch.object(CourseRun, 'search') as mock_course_run_search, \
+                    mock.patch.object(Course, 'search') as mock_course_search:
+                search_results = mock_course_run_search.return_value.filter.return_value
+                search_results.values_list.return_value = course_run_keys
+                mock_course_search.return_value = Course.objects.filter(pk__in=course_pks)
+
+                response = self.client.get(self.url_base + '/', data=dict(self.identifiers, query=query))
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data, expected)
+
+                mock_course_run_search.assert_called_once_with(query)
+                mock_course_run_search.return_value.filter.assert_called_once_with(
+                    partner=self.partner.short_code, key__in=mock.ANY
+                )
+                # The view extends the key list it filtered on with the course UUIDs afterwards, so only the
+                # leading course run keys are the ones that were searched for.
+                key_filter = mock_course_run_search.return_value.filter.call_args[1]['key__in']
+                self.assertEqual(key_filter[0], self.course_run.key)
+                mock_course_search.assert_called_once_with(query)
+
+
+class CatalogQueryViewSetErrorTests(CatalogQueryContainsTestCase):
+    """ Tests for invalid requests, which are rejected before any courses or runs are looked up. """
+    error_message = 'CatalogQueryContains endpoint requires query and identifiers list(s)'
 
     def test_no_identifiers(self):
         """ Verify that a 400 status is returned if request does not contain any identifier lists. """
-        qs = urllib.parse.urlencode({
+        response = self.client.get(self.url_base + '/', data={
             'query': 'id:*'
         })
-        url = '{}/?{}'.format(self.url_base, qs)
-        response = self.client.get(url)
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.data, self.error_message)
 
     def test_no_query(self):
         """ Verify that a 400 status is returned if request does not contain a querystring. """
-        qs = urllib.parse.urlencode({
-            'course_run_ids': self.course_run.key,
-            'course_uuids': self.course.uuid,
+        response = self.client.get(self.url_base + '/', data={
+            'course_run_ids': 'course-v1:TestX+Test100+2018',
+            'course_uuids': str(uuid.uuid4()),
         })
-        url = '{}/?{}'.format(self.url_base, qs)
-        response = self.client.get(url)
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.data, self.error_message)
@@ -1,16 +1,19 @@
 import datetime
+import functools
 import urllib.parse
 
 import ddt
+import mock
 import pytz
 from django.urls import reverse
 
 from course_discovery.apps.api import serializers
+from course_discovery.apps.api.tests.mixins import TEST_DOMAIN
 from course_discovery.apps.api.v1.tests.test_views import mixins
 from course_discovery.apps.api.v1.views.search import TypeaheadSearchView
 from course_discovery.apps.core.tests.factories import PartnerFactory
 from course_discovery.apps.core.tests.mixins import ElasticsearchTestMixin
-from course_discovery.apps.course_metadata.choices import CourseRunStatus, ProgramStatus
+from course_discovery.apps.course_metadata.choices import CourseRunPacing, CourseRunStatus, ProgramStatus
 from course_discovery.apps.course_metadata.models import CourseRun
 from course_discovery.apps.course_metadata.tests.factories import (
     CourseFactory, CourseRunFactory, OrganizationFactory, ProgramFactory
@@ -25,26 +28,37 @@ class CourseRunSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
     faceted_path = reverse('api:v1:search-course_runs-facets')
     list_path = reverse('api:v1:search-course_runs-list')
 
+    @classmethod
+    def setUpTestData(cls):
+        super(CourseRunSearchViewSetTests, cls).setUpTestData()
+        cls.create_site_and_partner()
+
+        # The search index is recreated for every test, so this run is only indexed when a test needs it.
+        with cls.realtime_indexing_disabled():
+            cls.shared_course_run = CourseRunFactory(course__partner=cls.partner, course__title='Software Testing',
+                                                     status=CourseRunStatus.Published)
+
     def get_response(self, query=None, path=None):
-        qs = urllib.parse.urlencode({'q': query}) if query else ''
-        path = path or self.list_path
-        url = '{path}?{qs}'.format(path=path, qs=qs)
-        return self.client.get(url)
-
-    def build_facet_url(self, params):
-        return 'http://testserver.fake{path}?{query}'.format(
-            path=self.faceted_path, query=urllib.parse.urlencode(params)
+        params = {'q': query} if query else {}
+        return self._get(path or self.list_path, **params)
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def build_facet_url(cls, facet):
+        """ Returns the narrow URL for a query facet. Only a handful of facets exist, so the URLs are cached. """
+        return 'http://{domain}{path}?selected_query_facets={facet}'.format(
+            domain=TEST_DOMAIN, path=cls.faceted_path, facet=urllib.parse.quote(facet)
         )
 
     def assert_successful_search(self, path=None, serializer=None):
         """ Asserts the search functionality returns results for a generated query. """
-        # Generate data that should be indexed and returned by the query
-        course_run = CourseRunFactory(course__partner=self.partner, course__title='Software Testing',
-                                      status=CourseRunStatus.Published)
+        # Index the data that should be returned by the query
+        course_run = self.shared_course_run
+        self.bulk_reindex([course_run])
         response = self.get_response('software', path=path)
 
         assert response.status_code == 200
-        response_data = response.json()
+        response_data = response.data
 
         # Validate the search results
         expected = {
@@ -54,7 +68,7 @@ class CourseRunSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
             ]
         }
         actual = response_data['objects'] if path == self.faceted_path else response_data
-        self.assertDictContainsSubset(expected, actual)
+        self.assert_dict_contains_subset(expected, actual)
 
         return course_run, response_data
 
@@ -63,22 +77,22 @@ class CourseRunSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
         expected = {
             'availability_archived': {
                 'count': 1,
-                'narrow_url': self.build_facet_url({'selected_query_facets': 'availability_archived'})
+                'narrow_url': self.build_facet_url('availability_archived')
             },
             'availability_current': {
                 'count': 1,
-                'narrow_url': self.build_facet_url({'selected_query_facets': 'availability_current'})
+                'narrow_url': self.build_facet_url('availability_current')
             },
             'availability_starting_soon': {
                 'count': 1,
-                'narrow_url': self.build_facet_url({'selected_query_facets': 'availability_starting_soon'})
+                'narrow_url': self.build_facet_url('availability_starting_soon')
             },
             'availability_upcoming': {
                 'count': 1,
-                'narrow_url': self.build_facet_url({'selected_query_facets': 'availability_upcoming'})
+                'narrow_url': self.build_facet_url('availability_upcoming')
             },
         }
-        self.assertDictContainsSubset(expected, response_data['queries'])
+        self.assert_dict_contains_subset(expected, response_data['queries'])
 
     @ddt.data(faceted_path, list_path, detailed_path)
     def test_authentication(self, path):
@@ -105,7 +119,40 @@ class CourseRunSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
             'text': course_run.pacing_type,
             'count': 1,
         }
-        self.assertDictContainsSubset(expected, response_data['fields']['pacing_type'][0])
+        self.assert_dict_contains_subset(expected, response_data['fields']['pacing_type'][0])
+
+    def test_faceted_search_single_query(self):
+        """ Verify the results, count, and facets of a faceted search are retrieved with a single search request. """
+        CourseRunFactory(course__partner=self.partner, status=CourseRunStatus.Published)
+
+        with mock.patch.object(self.es, 'search', wraps=self.es.search) as mock_search:
+            response = self.get_response(path=self.faceted_path)
+
+        assert response.status_code == 200
+        response_data = response.data
+        assert response_data['objects']['count'] == 1
+        assert len(response_data['objects']['results']) == 1
+        assert response_data['fields']['pacing_type'][0]['count'] == 1
+        assert mock_search.call_count == 1
+
+    def test_faceted_search_later_page(self):
+        """ Verify the page returned by the paginator is the page prefetched along with the facet counts. """
+        with self.realtime_indexing_disabled():
+            course_runs = [
+                CourseRunFactory(course__partner=self.partner, status=CourseRunStatus.Published) for __ in range(3)
+            ]
+        self.bulk_reindex(course_runs)
+
+        with mock.patch.object(self.es, 'search', wraps=self.es.search) as mock_search:
+            response = self._get(self.faceted_path, page=2, page_size=1)
+
+        assert response.status_code == 200
+        response_data = response.data['objects']
+        assert response_data['count'] == 3
+        assert response_data['previous'] is not None
+        assert len(response_data['results']) == 1
+        # The paginator makes a second search request if it slices a different page than the one prefetched.
+        assert mock_search.call_count == 1
 
     def test_invalid_query_facet(self):
         """ Verify the endpoint returns HTTP 400 if an invalid facet is requested. """
@@ -122,24 +169,28 @@ class CourseRunSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
     def test_availability_faceting(self):
         """ Verify the endpoint returns availability facets with the results. """
         now = datetime.datetime.now(pytz.UTC)
-        archived = CourseRunFactory(course__partner=self.partner, start=now - datetime.timedelta(weeks=2),
-                                    end=now - datetime.timedelta(weeks=1), status=CourseRunStatus.Published)
-        current = CourseRunFactory(course__partner=self.partner, start=now - datetime.timedelta(weeks=2),
-                                   end=now + datetime.timedelta(weeks=1), status=CourseRunStatus.Published)
-        starting_soon = CourseRunFactory(course__partner=self.partner, start=now + datetime.timedelta(days=10),
-                                         end=now + datetime.timedelta(days=90), status=CourseRunStatus.Published)
-        upcoming = CourseRunFactory(course__partner=self.partner, start=now + datetime.timedelta(days=61),
-                                    end=now + datetime.timedelta(days=90), status=CourseRunStatus.Published)
+        with self.realtime_indexing_disabled():
+            archived = CourseRunFactory(course__partner=self.partner, start=now - datetime.timedelta(weeks=2),
+                                        end=now - datetime.timedelta(weeks=1), status=CourseRunStatus.Published)
+            current = CourseRunFactory(course__partner=self.partner, start=now - datetime.timedelta(weeks=2),
+                                       end=now + datetime.timedelta(weeks=1), status=CourseRunStatus.Published)
+            starting_soon = CourseRunFactory(course__partner=self.partner, start=now + datetime.timedelta(days=10),
+                                             end=now + datetime.timedelta(days=90), status=CourseRunStatus.Published)
+            upcoming = CourseRunFactory(course__partner=self.partner, start=now + datetime.timedelta(days=61),
+                                        end=now + datetime.timedelta(days=90), status=CourseRunStatus.Published)
+        self.bulk_reindex([archived, current, starting_soon, upcoming])
 
         response = self.get_response(path=self.faceted_path)
         assert response.status_code == 200
-        response_data = response.json()
+        response_data = response.data
 
         # Verify all course runs are returned
         assert response_data['objects']['count'] == 4
 
-        for run in [archived, current, starting_soon, upcoming]:
-            serialized = self.serialize_course_run_search(run)
+        serialized_runs = {
+            run.pk: self.serialize_course_run_search(run) for run in [archived, current, starting_soon, upcoming]
+        }
+        for serialized in serialized_runs.values():
             # Force execution of lazy function.
             serialized['availability'] = serialized['availability'].strip()
             assert serialized in response_data['objects']['results']
@@ -152,8 +203,8 @@ class CourseRunSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
         )
         response = self.client.get(url)
         assert response.status_code == 200
-        response_data = response.json()
-        assert response_data['objects']['results'] == [self.serialize_course_run_search(archived)]
+        response_data = response.data
+        assert response_data['objects']['results'] == [serialized_runs[archived.pk]]
 
     @ddt.data(
         (list_path, serializers.CourseRunSearchSerializer,
@@ -161,24 +212,25 @@ class CourseRunSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
         (list_path, serializers.CourseRunSearchSerializer,
          ['results', 0, 'program_types', 0], ProgramStatus.Unpublished, 8),
         (detailed_path, serializers.CourseRunSearchModelSerializer,
-         ['results', 0, 'programs', 0, 'type'], ProgramStatus.Deleted, 40),
+         ['results', 0, 'programs', 0, 'type'], ProgramStatus.Deleted, 35),
         (detailed_path, serializers.CourseRunSearchModelSerializer,
-         ['results', 0, 'programs', 0, 'type'], ProgramStatus.Unpublished, 42),
+         ['results', 0, 'programs', 0, 'type'], ProgramStatus.Unpublished, 35),
     )
     @ddt.unpack
     def test_exclude_unavailable_program_types(self, path, serializer, result_location_keys, program_status,
                                                expected_queries):
         """ Verify that unavailable programs do not show in the program_types representation. """
-        course_run = CourseRunFactory(course__partner=self.partner, course__title='Software Testing',
-                                      status=CourseRunStatus.Published)
-        active_program = ProgramFactory(courses=[course_run.course], status=ProgramStatus.Active)
-        ProgramFactory(courses=[course_run.course], status=program_status)
-        self.reindex_courses(active_program)
+        with self.deferred_refresh():
+            course_run = CourseRunFactory(course__partner=self.partner, course__title='Software Testing',
+                                          status=CourseRunStatus.Published)
+            active_program = ProgramFactory(courses=[course_run.course], status=ProgramStatus.Active)
+            ProgramFactory(courses=[course_run.course], status=program_status)
+            self.reindex_courses(active_program)
 
         with self.assertNumQueries(expected_queries):
             response = self.get_response('software', path=path)
             assert response.status_code == 200
-            response_data = response.json()
+            response_data = response.data
 
             # Validate the search results
             expected = {
@@ -187,7 +239,7 @@ class CourseRunSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
                     self.serialize_course_run_search(course_run, serializer=serializer)
                 ]
             }
-            self.assertDictContainsSubset(expected, response_data)
+            self.assert_dict_contains_subset(expected, response_data)
 
             # Check that the program is indeed the active one.
             for key in result_location_keys:
@@ -207,28 +259,30 @@ class CourseRunSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
         course_run_list = []
         excluded_course_run_list = []
         non_excluded_course_run_list = []
-        for run in course_runs:
-            course_run = CourseRunFactory(course__partner=self.partner, course__title=run['title'],
-                                          status=CourseRunStatus.Published)
-            course_list.append(course_run.course)
-            course_run_list.append(course_run)
-            if run['excluded']:
-                excluded_course_run_list.append(course_run)
-            else:
-                non_excluded_course_run_list.append(course_run)
-
-        program = ProgramFactory(
-            courses=course_list,
-            status=ProgramStatus.Active,
-            excluded_course_runs=excluded_course_run_list
-        )
-        self.reindex_courses(program)
+        with self.realtime_indexing_disabled():
+            for run in course_runs:
+                course_run = CourseRunFactory(course__partner=self.partner, course__title=run['title'],
+                                              status=CourseRunStatus.Published)
+                course_list.append(course_run.course)
+                course_run_list.append(course_run)
+                if run['excluded']:
+                    excluded_course_run_list.append(course_run)
+                else:
+                    non_excluded_course_run_list.append(course_run)
+
+            ProgramFactory(
+                courses=course_list,
+                status=ProgramStatus.Active,
+                excluded_course_runs=excluded_course_run_list
+            )
+        # Index the runs once the program exists, so their program types are included.
+        self.bulk_reindex(course_run_list)
 
         with self.assertNumQueries(expected_queries):
             response = self.get_response('software', path=self.list_path)
 
         assert response.status_code == 200
-        response_data = response.json()
+        response_data = response.data
 
         assert response_data['count'] == len(course_run_list)
         for result in response_data['results']:
@@ -245,18 +299,13 @@ class CourseRunSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
 class AggregateSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin, ElasticsearchTestMixin,
                                   mixins.SynonymTestMixin, mixins.APITestCase):
     path = reverse('api:v1:search-all-facets')
+    NOW = datetime.datetime(2020, 1, 15, tzinfo=pytz.UTC)
 
     def get_response(self, query=None):
-        qs = ''
-
-        if query:
-            qs = urllib.parse.urlencode(query)
-
-        url = '{path}?{qs}'.format(path=self.path, qs=qs)
-        return self.client.get(url)
+        return self._get(self.path, **(query or {}))
 
     def process_response(self, response):
-        response = self.get_response(response).json()
+        response = self.get_response(response).data
         objects = response['objects']
         assert objects['count'] > 0
         return objects
@@ -272,7 +321,7 @@ class AggregateSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
 
         response = self.get_response()
         assert response.status_code == 200
-        response_data = response.json()
+        response_data = response.data
         assert response_data['objects']['results'] == \
             [self.serialize_program_search(program), self.serialize_course_run_search(course_run)]
 
@@ -284,7 +333,7 @@ class AggregateSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
         assert CourseRun.objects.get(hidden=True) == hidden_run
 
         response = self.get_response()
-        data = response.json()
+        data = response.data
         assert data['objects']['results'] == [self.serialize_course_run_search(visible_run)]
 
     def test_results_filtered_by_default_partner(self):
@@ -302,14 +351,14 @@ class AggregateSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
 
         response = self.get_response()
         assert response.status_code == 200
-        response_data = response.json()
+        response_data = response.data
         assert response_data['objects']['results'] == \
             [self.serialize_program_search(program), self.serialize_course_run_search(course_run)]
 
         # Filter results by partner
         response = self.get_response({'partner': other_partner.short_code})
         assert response.status_code == 200
-        response_data = response.json()
+        response_data = response.data
         assert response_data['objects']['results'] == \
             [self.serialize_program_search(other_program), self.serialize_course_run_search(other_course_run)]
 
@@ -321,18 +370,20 @@ class AggregateSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
 
         response = self.get_response({'q': '', 'content_type': ['courserun', 'program']})
         assert response.status_code == 200
-        response_data = response.json()
+        response_data = response.data
         assert response_data['objects']['results'] == \
             [self.serialize_program_search(program), self.serialize_course_run_search(course_run)]
 
     @ddt.data('start', '-start')
     def test_results_ordered_by_start_date(self, ordering):
         """ Verify the search results can be ordered by start date """
-        now = datetime.datetime.now(pytz.UTC)
-        archived = CourseRunFactory(course__partner=self.partner, start=now - datetime.timedelta(weeks=2))
-        current = CourseRunFactory(course__partner=self.partner, start=now - datetime.timedelta(weeks=1))
-        starting_soon = CourseRunFactory(course__partner=self.partner, start=now + datetime.timedelta(weeks=3))
-        upcoming = CourseRunFactory(course__partner=self.partner, start=now + datetime.timedelta(weeks=4))
+        # Only the relative order of the start dates matters here, so avoid depending on the clock.
+        now = self.NOW
+        with self.deferred_refresh():
+            archived = CourseRunFactory(course__partner=self.partner, start=now - datetime.timedelta(weeks=2))
+            current = CourseRunFactory(course__partner=self.partner, start=now - datetime.timedelta(weeks=1))
+            starting_soon = CourseRunFactory(course__partner=self.partner, start=now + datetime.timedelta(weeks=3))
+            upcoming = CourseRunFactory(course__partner=self.partner, start=now + datetime.timedelta(weeks=4))
         course_run_keys = [course_run.key for course_run in [archived, current, starting_soon, upcoming]]
 
         response = self.get_response({"ordering": ordering})
@@ -350,7 +401,7 @@ class AggregateSearchViewSetTests(mixins.SerializationMixin, mixins.LoginMixin,
 
         response = self.get_response()
         assert response.status_code == 200
-        response_data = response.json()
+        response_data = response.data
 
         expected = sorted(
             ['courserun:{}'.format(course_run.course.key), 'program:{}'.format(program.uuid)]
@@ -373,7 +424,7 @@ class AggregateCatalogSearchViewSetTests(mixins.SerializationMixin, mixins.Login
         data = {'content_type': 'course', 'aggregation_key': ['course:edX+DemoX']}
         expected = {'previous': None, 'results': [], 'next': None, 'count': 0}
         response = self.client.post(self.path, data=data, format='json')
-        assert response.json() == expected
+        assert response.data == expected
 
     def test_get(self):
         """
@@ -382,26 +433,29 @@ class AggregateCatalogSearchViewSetTests(mixins.SerializationMixin, mixins.Login
         CourseFactory(key='course:edX+DemoX', title='ABCs of Ͳҽʂէìղց')
         expected = {'previous': None, 'results': [], 'next': None, 'count': 0}
         query = {'content_type': 'course', 'aggregation_key': ['course:edX+DemoX']}
-        qs = urllib.parse.urlencode(query)
-        url = '{path}?{qs}'.format(path=self.path, qs=qs)
-        response = self.client.get(url)
-        assert response.json() == expected
+        response = self._get(self.path, **query)
+        assert response.data == expected
 
 
 class TypeaheadSearchViewTests(mixins.TypeaheadSerializationMixin, mixins.LoginMixin, ElasticsearchTestMixin,
                                mixins.SynonymTestMixin, mixins.APITestCase):
     path = reverse('api:v1:search-typeahead')
 
+    @classmethod
+    def setUpTestData(cls):
+        super(TypeaheadSearchViewTests, cls).setUpTestData()
+        cls.create_site_and_partner()
+        cls.authoring_organizations = OrganizationFactory.create_batch(3, partner=cls.partner)
+        cls.mitx = OrganizationFactory(key='MITx', partner=cls.partner)
+        cls.harvardx = OrganizationFactory(key='HarvardX', partner=cls.partner)
+
     def get_response(self, query=None, partner=None):
         query_dict = query or {}
         query_dict.update({'partner': partner or self.partner.short_code})
-        qs = urllib.parse.urlencode(query_dict)
-
-        url = '{path}?{qs}'.format(path=self.path, qs=qs)
-        return self.client.get(url)
+        return self._get(self.path, **query_dict)
 
     def process_response(self, response):
-        response = self.get_response(response).json()
+        response = self.get_response(response).data
         self.assertTrue(response['course_runs'] or response['programs'])
         return response
 
@@ -412,36 +466,62 @@ class TypeaheadSearchViewTests(mixins.TypeaheadSerializationMixin, mixins.LoginM
         program = ProgramFactory(title=title, status=ProgramStatus.Active, partner=self.partner)
         response = self.get_response({'q': title})
         self.assertEqual(response.status_code, 200)
-        response_data = response.json()
+        response_data = response.data
         self.assertDictEqual(response_data, {'course_runs': [self.serialize_course_run_search(course_run)],
                                              'programs': [self.serialize_program_search(program)]})
 
+    def test_typeahead_source_fields(self):
+        """ Verify typeahead only fetches the index fields it serializes. """
+        title = "Python"
+        course_run = CourseRunFactory(title=title, course__partner=self.partner)
+        program = ProgramFactory(title=title, status=ProgramStatus.Active, partner=self.partner)
+
+        with mock.patch.object(self.es, 'search', wraps=self.es.search) as mock_search:
+            response = self.get_response({'q': title})
+
+        assert response.status_code == 200
+        assert response.data == {'course_runs': [self.serialize_course_run_search(course_run)],
+                                 'programs': [self.serialize_program_search(program)]}
+        for call in mock_search.call_args_list:
+            assert 'django_ct' in call[1]['_source_include']
+            assert 'description' not in call[1]['_source_include']
+
     def test_typeahead_multiple_results(self):
         """ Verify the typeahead responses always returns a limited number of results, even if there are more hits. """
         RESULT_COUNT = TypeaheadSearchView.RESULT_COUNT
         title = "Test"
-        for i in range(RESULT_COUNT + 1):
-            CourseRunFactory(title="{}{}".format(title, i), course__partner=self.partner)
-            ProgramFactory(title="{}{}".format(title, i), status=ProgramStatus.Active, partner=self.partner)
+        with self.realtime_indexing_disabled():
+            course_runs = [
+                CourseRunFactory(title="{}{}".format(title, i), course__partner=self.partner)
+                for i in range(RESULT_COUNT + 1)
+            ]
+            programs = [
+                ProgramFactory(title="{}{}".format(title, i), status=ProgramStatus.Active, partner=self.partner)
+                for i in range(RESULT_COUNT + 1)
+            ]
+        self.bulk_reindex(course_runs + programs)
         response = self.get_response({'q': title})
         self.assertEqual(response.status_code, 200)
-        response_data = response.json()
+        response_data = response.data
         self.assertEqual(len(response_data['course_runs']), RESULT_COUNT)
         self.assertEqual(len(response_data['programs']), RESULT_COUNT)
 
+    # Use a page smaller than the number of runs per course to deduplicate across search requests.
+    @mock.patch.object(TypeaheadSearchView, 'COURSE_RUN_PAGE_SIZE', 2)
     def test_typeahead_deduplicate_course_runs(self):
         """ Verify the typeahead response will only include the first course run per course. """
         RESULT_COUNT = TypeaheadSearchView.RESULT_COUNT
         title = "Test"
-        course1 = CourseFactory(partner=self.partner)
-        course2 = CourseFactory(partner=self.partner)
-        for i in range(RESULT_COUNT):
-            CourseRunFactory(title="{}{}{}".format(title, course1.title, i), course=course1)
-        for i in range(RESULT_COUNT):
-            CourseRunFactory(title="{}{}{}".format(title, course2.title, i), course=course2)
+        with self.deferred_refresh():
+            course1 = CourseFactory(partner=self.partner)
+            course2 = CourseFactory(partner=self.partner)
+            for i in range(RESULT_COUNT):
+                CourseRunFactory(title="{}{}{}".format(title, course1.title, i), course=course1)
+            for i in range(RESULT_COUNT):
+                CourseRunFactory(title="{}{}{}".format(title, course2.title, i), course=course2)
         response = self.get_response({'q': title})
         assert response.status_code == 200
-        response_data = response.json()
+        response_data = response.data
 
         # There are many runs for both courses, but only one from each will be included
         course_runs = response_data['course_runs']
@@ -452,7 +532,7 @@ class TypeaheadSearchViewTests(mixins.TypeaheadSerializationMixin, mixins.LoginM
     def test_typeahead_multiple_authoring_organizations(self):
         """ Test typeahead response with multiple authoring organizations. """
         title = "Design"
-        authoring_organizations = OrganizationFactory.create_batch(3)
+        authoring_organizations = self.authoring_organizations
         course_run = CourseRunFactory(
             title=title,
             authoring_organizations=authoring_organizations,
@@ -464,7 +544,7 @@ class TypeaheadSearchViewTests(mixins.TypeaheadSerializationMixin, mixins.LoginM
         )
         response = self.get_response({'q': title})
         self.assertEqual(response.status_code, 200)
-        response_data = response.json()
+        response_data = response.data
         self.assertDictEqual(response_data, {'course_runs': [self.serialize_course_run_search(course_run)],
                                              'programs': [self.serialize_program_search(program)]})
 
@@ -476,7 +556,7 @@ class TypeaheadSearchViewTests(mixins.TypeaheadSerializationMixin, mixins.LoginM
         query = "Data Sci"
         response = self.get_response({'q': query})
         self.assertEqual(response.status_code, 200)
-        response_data = response.json()
+        response_data = response.data
         expected_response_data = {
             'course_runs': [self.serialize_course_run_search(course_run)],
             'programs': [self.serialize_program_search(program)]
@@ -495,7 +575,7 @@ class TypeaheadSearchViewTests(mixins.TypeaheadSerializationMixin, mixins.LoginM
         query = "suppl"
         response = self.get_response({'q': query})
         self.assertEqual(response.status_code, 200)
-        response_data = response.json()
+        response_data = response.data
         expected_response_data = {
             'course_runs': [self.serialize_course_run_search(course_run)],
             'programs': [self.serialize_program_search(program)]
@@ -509,7 +589,7 @@ class TypeaheadSearchViewTests(mixins.TypeaheadSerializationMixin, mixins.LoginM
         ProgramFactory(title=program.title + 'hidden', hidden=True, status=ProgramStatus.Active, partner=self.partner)
         response = self.get_response({'q': program.title})
         self.assertEqual(response.status_code, 200)
-        response_data = response.json()
+        response_data = response.data
         expected_response_data = {
             'course_runs': [],
             'programs': [self.serialize_program_search(program)]
@@ -524,7 +604,7 @@ class TypeaheadSearchViewTests(mixins.TypeaheadSerializationMixin, mixins.LoginM
 
     def test_typeahead_authoring_organizations_partial_search(self):
         """ Test typeahead response with partial organization matching. """
-        authoring_organizations = OrganizationFactory.create_batch(3)
+        authoring_organizations = self.authoring_organizations
         course_run = CourseRunFactory(authoring_organizations=authoring_organizations, course__partner=self.partner)
         program = ProgramFactory(authoring_organizations=authoring_organizations, partner=self.partner)
         partial_key = authoring_organizations[0].key[0:5]
@@ -539,28 +619,29 @@ class TypeaheadSearchViewTests(mixins.TypeaheadSerializationMixin, mixins.LoginM
 
     def test_typeahead_org_course_runs_come_up_first(self):
         """ Test typeahead response to ensure org is taken into account. """
-        MITx = OrganizationFactory(key='MITx')
-        HarvardX = OrganizationFactory(key='HarvardX')
-        mit_run = CourseRunFactory(
-            authoring_organizations=[MITx, HarvardX],
-            title='MIT Testing1',
-            course__partner=self.partner
-        )
-        harvard_run = CourseRunFactory(
-            authoring_organizations=[HarvardX],
-            title='MIT Testing2',
-            course__partner=self.partner
-        )
-        mit_program = ProgramFactory(
-            authoring_organizations=[MITx, HarvardX],
-            title='MIT Testing1',
-            partner=self.partner
-        )
-        harvard_program = ProgramFactory(
-            authoring_organizations=[HarvardX],
-            title='MIT Testing2',
-            partner=self.partner
-        )
+        MITx = self.mitx
+        HarvardX = self.harvardx
+        with self.deferred_refresh():
+            mit_run = CourseRunFactory(
+                authoring_organizations=[MITx, HarvardX],
+                title='MIT Testing1',
+                course__partner=self.partner
+            )
+            harvard_run = CourseRunFactory(
+                authoring_organizations=[HarvardX],
+                title='MIT Testing2',
+                course__partner=self.partner
+            )
+            mit_program = ProgramFactory(
+                authoring_organizations=[MITx, HarvardX],
+                title='MIT Testing1',
+                partner=self.partner
+            )
+            harvard_program = ProgramFactory(
+                authoring_organizations=[HarvardX],
+                title='MIT Testing2',
+                partner=self.partner
+            )
         response = self.get_response({'q': 'mit'})
         self.assertEqual(response.status_code, 200)
         expected = {
@@ -570,3 +651,41 @@ class TypeaheadSearchViewTests(mixins.TypeaheadSerializationMixin, mixins.LoginM
                          self.serialize_program_search(harvard_program)]
         }
         self.assertDictEqual(response.data, expected)
+
+    def test_typeahead_org_key_match_comes_up_first(self):
+        """ Verify results authored by an organization whose key matches the query rank above title matches. """
+        # Typeahead queries are wrapped in the boost config's function_score. Fixing the fields its functions read
+        # gives both runs the same function score, so only the organization key and title matches set the order.
+        start = datetime.datetime(2014, 1, 1, tzinfo=pytz.UTC)
+        end = datetime.datetime(2014, 6, 1, tzinfo=pytz.UTC)
+        boosted_fields = {
+            'pacing_type': CourseRunPacing.Instructor,
+            'start': start,
+            'end': end,
+            'enrollment_start': start,
+            'enrollment_end': end,
+        }
+        harvard_run = CourseRunFactory(
+            authoring_organizations=[self.harvardx],
+            title='MITx Testing',
+            course__partner=self.partner,
+            **boosted_fields
+        )
+        mit_run = CourseRunFactory(
+            authoring_organizations=[self.mitx],
+            title='Testing',
+            course__partner=self.partner,
+            **boosted_fields
+        )
+
+        with mock.patch.object(self.es, 'search', wraps=self.es.search) as mock_search:
+            response = self.get_response({'q': 'mitx'})
+
+        self.assertEqual(response.status_code, 200)
+        assert mock_search.called
+        for call in mock_search.call_args_list:
+            assert 'function_score' in call[1]['body']['query']['filtered']['query']
+        self.assertEqual(
+            response.data['course_runs'],
+            [self.serialize_course_run_search(mit_run), self.serialize_course_run_search(harvard_run)]
+        )
@@ -4,11 +4,12 @@ from drf_haystack.mixins import FacetMixin
 from drf_haystack.viewsets import HaystackViewSet
 from haystack.backends import SQ
 from haystack.inputs import AutoQuery
-from haystack.query import SearchQuerySet
+from haystack.query import RelatedSearchQuerySet
 from rest_framework import renderers, status, viewsets
 from rest_framework.decorators import list_route
 from rest_framework.exceptions import ParseError, ValidationError
 from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -16,6 +17,7 @@ from rest_framework.views import APIView
 from course_discovery.apps.api import filters, mixins, serializers
 from course_discovery.apps.course_metadata.choices import ProgramStatus
 from course_discovery.apps.course_metadata.models import Course, CourseRun, Person, Program
+from course_discovery.apps.edx_haystack_extensions.query import SourceFilteringSearchQuerySet
 
 
 class BaseHaystackViewSet(mixins.DetailMixin, FacetMixin, HaystackViewSet):
@@ -40,6 +42,8 @@ class BaseHaystackViewSet(mixins.DetailMixin, FacetMixin, HaystackViewSet):
         """
         return super(BaseHaystackViewSet, self).list(request, *args, **kwargs)
 
+    # Overrides FacetMixin.facets from:
+    # https://github.com/inonit/drf-haystack/blob/v1.6.1/drf_haystack/mixins.py#L47
     @list_route(methods=['get'], url_path='facets')
     def facets(self, request):
         """
@@ -68,7 +72,48 @@ class BaseHaystackViewSet(mixins.DetailMixin, FacetMixin, HaystackViewSet):
                 pytype: str
               required: false
         """
-        return super(BaseHaystackViewSet, self).facets(request)
+        queryset = self.filter_facet_queryset(self.get_queryset())
+
+        for facet in request.query_params.getlist(self.facet_query_params_text):
+            if ':' not in facet:
+                continue
+
+            field, value = facet.split(':', 1)
+            if value:
+                queryset = queryset.narrow('{field}:"{value}"'.format(field=field, value=queryset.query.clean(value)))
+
+        self.prefetch_page(queryset)
+
+        serializer = self.get_facet_serializer(queryset.facet_counts(), objects=queryset, many=False)
+        return Response(serializer.data)
+
+    def prefetch_page(self, queryset):
+        """
+        Populate the queryset's result cache with the requested page of results.
+
+        Elasticsearch returns the page of results, the total hit count, and the facet counts in a single response.
+        Fetching the page before anything else caches all three on the queryset, so the facet counts and the
+        paginator's count can be served without issuing additional search requests.
+        """
+        paginator = self.paginator
+        if not isinstance(paginator, PageNumberPagination):
+            return
+
+        page_size = paginator.get_page_size(self.request)
+        if not page_size:
+            return
+
+        try:
+            page_number = int(self.request.query_params.get(paginator.page_query_param, 1))
+        except ValueError:
+            # Let the paginator handle (or reject) non-numeric page numbers, such as "last".
+            return
+
+        if page_number < 1:
+            return
+
+        start = (page_number - 1) * page_size
+        list(queryset[start:start + page_size])
 
     def filter_facet_queryset(self, queryset):
         queryset = super().filter_facet_queryset(queryset)
@@ -129,10 +174,22 @@ class CourseSearchViewSet(BaseHaystackViewSet):
 
 class CourseRunSearchViewSet(BaseHaystackViewSet):
     index_models = (CourseRun,)
+    # Only RelatedSearchQuerySet supports load_all_queryset, used by get_queryset.
+    object_class = RelatedSearchQuerySet
     detail_serializer_class = serializers.CourseRunSearchModelSerializer
     facet_serializer_class = serializers.CourseRunFacetSerializer
     serializer_class = serializers.CourseRunSearchSerializer
 
+    def get_queryset(self, *args, **kwargs):
+        queryset = super(CourseRunSearchViewSet, self).get_queryset(*args, **kwargs)
+
+        if self.action == 'details':
+            # Load the matching course runs with their related objects in bulk, rather than
+            # querying for each course run's programs as it is serialized.
+            queryset = queryset.load_all_queryset(CourseRun, self.detail_serializer_class.prefetch_queryset())
+
+        return queryset
+
 
 class ProgramSearchViewSet(BaseHaystackViewSet):
     document_uid_field = 'uuid'
@@ -163,38 +220,56 @@ class PersonSearchViewSet(BaseHaystackViewSet):
 class TypeaheadSearchView(APIView):
     """ Typeahead for courses and programs. """
     RESULT_COUNT = 3
+    # Number of course run hits fetched per search request while deduplicating by course.
+    COURSE_RUN_PAGE_SIZE = 20
+    # Index fields read while deduplicating and serializing results. No other fields are fetched.
+    COURSE_RUN_FIELDS = ('authoring_organization_bodies', 'course_key', 'key', 'marketing_url', 'title')
+    PROGRAM_FIELDS = ('authoring_organization_bodies', 'marketing_url', 'title', 'type', 'uuid')
     permission_classes = (IsAuthenticated,)
 
     def get_results(self, query, partner):
-        sqs = SearchQuerySet()
+        sqs = SourceFilteringSearchQuerySet()
         clean_query = sqs.query.clean(query)
 
         course_runs = sqs.models(CourseRun).filter(
             SQ(title_autocomplete=clean_query) |
             SQ(course_key=clean_query) |
-            SQ(authoring_organizations_autocomplete=clean_query)
+            SQ(authoring_organizations_autocomplete=clean_query) |
+            SQ(authoring_organization_keys=clean_query)
         )
         course_runs = course_runs.filter(published=True).exclude(hidden=True).filter(partner=partner.short_code)
+        course_runs = course_runs.source_fields(*self.COURSE_RUN_FIELDS)
 
-        # Get first three results after deduplicating by course key.
+        # Get first three results after deduplicating by course key. Results are fetched a page at a time;
+        # iterating over the queryset would pull in HAYSTACK_ITERATOR_LOAD_PER_QUERY hits up front.
         seen_course_keys, course_run_list = set(), []
-        for course_run in course_runs:
-            course_key = course_run.course_key
+        start = 0
+        while len(course_run_list) < self.RESULT_COUNT:
+            page = course_runs[start:start + self.COURSE_RUN_PAGE_SIZE]
+            if not page:
+                break
 
-            if course_key in seen_course_keys:
-                continue
-            else:
-                seen_course_keys.add(course_key)
-                course_run_list.append(course_run)
+            for course_run in page:
+                course_key = course_run.course_key
 
-            if len(course_run_list) == self.RESULT_COUNT:
-                break
+                if course_key in seen_course_keys:
+                    continue
+                else:
+                    seen_course_keys.add(course_key)
+                    course_run_list.append(course_run)
+
+                if len(course_run_list) == self.RESULT_COUNT:
+                    break
+
+            start += self.COURSE_RUN_PAGE_SIZE
 
         programs = sqs.models(Program).filter(
             SQ(title_autocomplete=clean_query) |
-            SQ(authoring_organizations_autocomplete=clean_query)
+            SQ(authoring_organizations_autocomplete=clean_query) |
+            SQ(authoring_organization_keys=clean_query)
         )
         programs = programs.filter(status=ProgramStatus.Active).exclude(hidden=True).filter(partner=partner.short_code)
+        programs = programs.source_fields(*self.PROGRAM_FIELDS)
         programs = programs[:self.RESULT_COUNT]
 
         return course_run_list, programs
@@ -1,8 +1,12 @@
+import functools
 import json
 import logging
+from collections import defaultdict
+from contextlib import contextmanager
 
 import pytest
 import responses
+from django.apps import apps
 from django.conf import settings
 from haystack import connections as haystack_connections
 
@@ -28,6 +32,59 @@ class ElasticsearchTestMixin(object):
         """
         ElasticsearchUtils.refresh_index(self.es, self.index)
 
+    @staticmethod
+    @contextmanager
+    def realtime_indexing_disabled():
+        """
+        Stops Haystack's signal processor from indexing each model instance as it is saved.
+
+        Use with bulk_reindex() to index objects created in a loop with a single request. Prefer this when the test
+        knows exactly which objects belong in the index. Use deferred_refresh() when the objects should be indexed by
+        the signal processor, as they would be outside tests.
+        """
+        signal_processor = apps.get_app_config('haystack').signal_processor
+        signal_processor.teardown()
+        try:
+            yield
+        finally:
+            signal_processor.setup()
+
+    @contextmanager
+    def deferred_refresh(self):
+        """
+        Skips the index refresh Haystack issues after every update, and refreshes the index once on exit instead.
+
+        Objects saved within the block are indexed as usual, but are not searchable until the block exits. Blocks may
+        be nested.
+        """
+        backend = haystack_connections['default'].get_backend()
+        # An enclosing block has already replaced update on the instance, and must get its replacement back.
+        previous_update = backend.__dict__.get('update')
+        backend.update = functools.partial(backend.update, commit=False)
+        try:
+            yield
+        finally:
+            if previous_update is None:
+                del backend.update
+            else:
+                backend.update = previous_update
+            self.refresh_index()
+
+    def bulk_reindex(self, objs):
+        """ Indexes the given model instances with one bulk request per model, followed by a single refresh. """
+        connection = haystack_connections['default']
+        unified_index = connection.get_unified_index()
+        backend = connection.get_backend()
+
+        objs_by_model = defaultdict(list)
+        for obj in objs:
+            objs_by_model[type(obj)].append(obj)
+
+        for model, instances in objs_by_model.items():
+            backend.update(unified_index.get_index(model), instances, commit=False)
+
+        self.refresh_index()
+
     def reindex_course_runs(self, course):
         index = haystack_connections['default'].get_unified_index().get_index(CourseRun)
         for course_run in course.course_runs.all():
@@ -85,9 +85,17 @@ class BaseIndex(indexes.SearchIndex):
     def index_queryset(self, using=None):
         return self.model.objects.all()
 
+    def read_queryset(self, using=None):
+        # Haystack loads search results with index_queryset by default. Subclasses prefetch in index_queryset for
+        # document preparation; loading search results doesn't need those prefetches, so read from the plain manager.
+        return self.model.objects.all()
+
     def prepare_authoring_organization_uuids(self, obj):
         return [str(organization.uuid) for organization in obj.authoring_organizations.all()]
 
+    def prepare_authoring_organization_keys(self, obj):
+        return [organization.key for organization in obj.authoring_organizations.all()]
+
     def _prepare_language(self, language):
         if language:
             # ECOM-5466: Render the macro language for all languages except Chinese
@@ -156,6 +164,9 @@ class CourseIndex(BaseCourseIndex, indexes.Indexable):
 
     prerequisites = indexes.MultiValueField(faceted=True)
 
+    def index_queryset(self, using=None):
+        return super().index_queryset(using=using).prefetch_related('authoring_organizations')
+
     def prepare_aggregation_key(self, obj):
         return 'course:{}'.format(obj.key)
 
@@ -210,6 +221,7 @@ class CourseRunIndex(BaseCourseIndex, indexes.Indexable):
     hidden = indexes.BooleanField(model_attr='hidden', faceted=True)
     mobile_available = indexes.BooleanField(model_attr='mobile_available', faceted=True)
     authoring_organization_uuids = indexes.MultiValueField()
+    authoring_organization_keys = indexes.MultiValueField(boost=ORG_FIELD_BOOST)
     staff_uuids = indexes.MultiValueField()
     subject_uuids = indexes.MultiValueField()
     has_enrollable_paid_seats = indexes.BooleanField(null=False)
@@ -220,6 +232,11 @@ class CourseRunIndex(BaseCourseIndex, indexes.Indexable):
     has_enrollable_seats = indexes.BooleanField(model_attr='has_enrollable_seats', null=False)
     is_current_and_still_upgradeable = indexes.BooleanField(null=False)
 
+    def index_queryset(self, using=None):
+        return super().index_queryset(using=using).select_related('course').prefetch_related(
+            'course__authoring_organizations'
+        )
+
     def prepare_aggregation_key(self, obj):
         # Aggregate CourseRuns by Course key since that is how we plan to dedup CourseRuns on the marketing site.
         return 'courserun:{}'.format(obj.course.key)
@@ -286,6 +303,7 @@ class ProgramIndex(BaseIndex, indexes.Indexable, OrganizationsMixin):
     authoring_organizations = indexes.MultiValueField(faceted=True)
     authoring_organizations_autocomplete = indexes.NgramField(boost=ORG_FIELD_BOOST)
     authoring_organization_uuids = indexes.MultiValueField()
+    authoring_organization_keys = indexes.MultiValueField(boost=ORG_FIELD_BOOST)
     subject_uuids = indexes.MultiValueField()
     staff_uuids = indexes.MultiValueField()
     authoring_organization_bodies = indexes.MultiValueField()
@@ -306,6 +324,9 @@ class ProgramIndex(BaseIndex, indexes.Indexable, OrganizationsMixin):
         model_attr='is_program_eligible_for_one_click_purchase', null=False
     )
 
+    def index_queryset(self, using=None):
+        return super().index_queryset(using=using).prefetch_related('authoring_organizations')
+
     def prepare_aggregation_key(self, obj):
         return 'program:{}'.format(obj.uuid)
 
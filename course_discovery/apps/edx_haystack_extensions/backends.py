@@ -1,4 +1,10 @@
-from haystack.backends.elasticsearch_backend import ElasticsearchSearchBackend, ElasticsearchSearchEngine
+import elasticsearch
+from haystack.backends import log_query
+from haystack.backends.elasticsearch_backend import (
+    ElasticsearchSearchBackend, ElasticsearchSearchEngine, ElasticsearchSearchQuery
+)
+from haystack.constants import DJANGO_CT, DJANGO_ID
+from haystack.models import SearchResult
 
 from course_discovery.apps.edx_haystack_extensions.elasticsearch_boost_config import get_elasticsearch_boost_config
 
@@ -54,6 +60,40 @@ class SimpleQuerySearchBackendMixin(object):
         return search_kwargs
 
 
+class FilterQueryFacetSearchBackendMixin(object):
+    """
+    Mixin that computes query facets with Elasticsearch filter facets.
+
+    Haystack sends query facets to Elasticsearch as query facets, which score every matching document even though
+    only the document count is used. Filter facets return the same count without scoring.
+    """
+
+    def build_search_kwargs(self, *args, **kwargs):
+        """
+        Override default `build_search_kwargs` method to convert query facets into filter facets.
+
+        source:
+          https://github.com/django-haystack/django-haystack/blob/v2.5.0/haystack/backends/elasticsearch_backend.py#L398
+        """
+        search_kwargs = super(FilterQueryFacetSearchBackendMixin, self).build_search_kwargs(*args, **kwargs)
+
+        for facet_fieldname, __ in kwargs.get('query_facets') or []:
+            facet_query = search_kwargs['facets'][facet_fieldname].pop('query')
+            search_kwargs['facets'][facet_fieldname]['filter'] = {'query': facet_query}
+
+        return search_kwargs
+
+    def _process_results(self, raw_results, *args, **kwargs):
+        """ Add the counts of filter facets to the query facet counts returned by Haystack. """
+        results = super(FilterQueryFacetSearchBackendMixin, self)._process_results(raw_results, *args, **kwargs)
+
+        for facet_fieldname, facet_info in raw_results.get('facets', {}).items():
+            if facet_info.get('_type') == 'filter':
+                results['facets']['queries'][facet_fieldname] = facet_info['count']
+
+        return results
+
+
 class NonClearingSearchBackendMixin(object):
     """
     Mixin that prevents indexes from being cleared.
@@ -118,8 +158,80 @@ class ConfigurableElasticBackend(ElasticsearchSearchBackend):
         return (content_field_name, mapping)
 
 
+class SourceFilteringSearchBackendMixin(object):
+    """
+    Mixin that allows a search to return only a subset of each document's source fields.
+
+    Callers request this by passing a list of field names as the `source_fields` search keyword argument (see
+    `SourceFilteringSearchQuerySet.source_fields`). Elasticsearch then ships, and Haystack parses, only those
+    fields, which matters for searches that iterate over many hits but only display a few fields.
+    """
+
+    def search(self, query_string, **kwargs):
+        source_fields = kwargs.pop('source_fields', None)
+
+        if not source_fields or len(query_string) == 0:
+            return super(SourceFilteringSearchBackendMixin, self).search(query_string, **kwargs)
+
+        return self._search_with_source_fields(query_string, source_fields, **kwargs)
+
+    @log_query
+    def _search_with_source_fields(self, query_string, source_fields, **kwargs):
+        """
+        Run the search, restricting the returned document source to the given fields.
+
+        Re-implements ElasticsearchSearchBackend.search from:
+        https://github.com/django-haystack/django-haystack/blob/v2.5.0/haystack/backends/elasticsearch_backend.py#L495
+
+        Haystack always passes `_source=True` on the querystring, which overrides any source filtering specified in
+        the request body, so the fields have to be passed as the `_source_include` querystring parameter instead.
+        """
+        if not self.setup_complete:
+            self.setup()
+
+        search_kwargs = self.build_search_kwargs(query_string, **kwargs)
+        search_kwargs['from'] = kwargs.get('start_offset', 0)
+
+        order_fields = set()
+        for order in search_kwargs.get('sort', []):
+            for key in order.keys():
+                order_fields.add(key)
+
+        geo_sort = '_geo_distance' in order_fields
+
+        end_offset = kwargs.get('end_offset')
+        start_offset = kwargs.get('start_offset', 0)
+        if end_offset is not None and end_offset > start_offset:
+            search_kwargs['size'] = end_offset - start_offset
+
+        # Haystack needs these fields to map each hit back to its model.
+        source_include = sorted(set(source_fields) | {DJANGO_CT, DJANGO_ID})
+
+        try:
+            raw_results = self.conn.search(
+                body=search_kwargs,
+                index=self.index_name,
+                doc_type='modelresult',
+                _source=True,
+                _source_include=','.join(source_include)
+            )
+        except elasticsearch.TransportError as e:
+            if not self.silently_fail:
+                raise
+
+            self.log.error('Failed to query Elasticsearch using "%s": %s', query_string, e, exc_info=True)
+            raw_results = {}
+
+        return self._process_results(raw_results,
+                                     highlight=kwargs.get('highlight'),
+                                     result_class=kwargs.get('result_class', SearchResult),
+                                     distance_point=kwargs.get('distance_point'),
+                                     geo_sort=geo_sort)
+
+
 # pylint: disable=abstract-method
-class EdxElasticsearchSearchBackend(SimpleQuerySearchBackendMixin, NonClearingSearchBackendMixin,
+class EdxElasticsearchSearchBackend(SimpleQuerySearchBackendMixin, FilterQueryFacetSearchBackendMixin,
+                                    SourceFilteringSearchBackendMixin, NonClearingSearchBackendMixin,
                                     ConfigurableElasticBackend):
     def search(self, query_string, **kwargs):
         # NOTE (CCB): Haystack by default attempts to read/update the index mapping. Given that our mapping doesn't
@@ -129,5 +241,32 @@ class EdxElasticsearchSearchBackend(SimpleQuerySearchBackendMixin, NonClearingSe
         return super().search(query_string, **kwargs)
 
 
+class EdxElasticsearchSearchQuery(ElasticsearchSearchQuery):
+    """ Custom Haystack Query class that can restrict the document fields returned for each hit. """
+
+    def __init__(self, **kwargs):
+        super(EdxElasticsearchSearchQuery, self).__init__(**kwargs)
+        self.source_fields = None
+
+    def set_source_fields(self, fields):
+        """ Only return the given index fields for each hit. """
+        self.source_fields = list(fields)
+
+    def build_params(self, spelling_query=None, **kwargs):
+        search_kwargs = super(EdxElasticsearchSearchQuery, self).build_params(spelling_query, **kwargs)
+
+        if self.source_fields:
+            search_kwargs['source_fields'] = self.source_fields
+
+        return search_kwargs
+
+    def _clone(self, **kwargs):
+        clone = super(EdxElasticsearchSearchQuery, self)._clone(**kwargs)
+        if isinstance(clone, EdxElasticsearchSearchQuery):
+            clone.source_fields = self.source_fields
+        return clone
+
+
 class EdxElasticsearchSearchEngine(ElasticsearchSearchEngine):
     backend = EdxElasticsearchSearchBackend
+    query = EdxElasticsearchSearchQuery
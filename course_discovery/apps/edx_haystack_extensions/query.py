@@ -0,0 +1,15 @@
+from haystack.query import SearchQuerySet
+
+
+class SourceFilteringSearchQuerySet(SearchQuerySet):
+    """ Custom SearchQuerySet class that can restrict the index fields returned for each hit. """
+
+    def source_fields(self, *fields):
+        """
+        Only return the given index fields for each hit.
+
+        Requires the EdxElasticsearchSearchQuery query class, which passes the fields on to the backend.
+        """
+        clone = self._clone()
+        clone.query.set_source_fields(fields)
+        return clone
@@ -120,6 +120,28 @@ class SimpleQuerySearchBackendMixinTestMixin(SearchBackendTestMixin):
         self.assertDictEqual(kwargs['query'], expected_function_score)
 
 
+class FilterQueryFacetSearchBackendMixinTestMixin(SearchBackendTestMixin):
+    """ Test class mixin for testing children of FilterQueryFacetSearchBackendMixin. """
+
+    def test_build_search_kwargs_query_facets(self):
+        """ Verify query facets are sent to Elasticsearch as filter facets. """
+        query_facets = [('availability_archived', 'end:<=now')]
+        with patch.object(BaseSearchBackend, 'build_models_list', return_value=[]):
+            kwargs = self.backend.build_search_kwargs('*:*', query_facets=query_facets)
+
+        expected = {'filter': {'query': {'query_string': {'query': 'end:<=now'}}}}
+        self.assertDictEqual(kwargs['facets']['availability_archived'], expected)
+
+    def test_process_results_filter_facets(self):
+        """ Verify the counts of filter facets are returned as query facet counts. """
+        raw_results = {
+            'hits': {'total': 0, 'hits': []},
+            'facets': {'availability_archived': {'_type': 'filter', 'count': 3}},
+        }
+        results = self.backend._process_results(raw_results)  # pylint: disable=protected-access
+        self.assertDictEqual(results['facets']['queries'], {'availability_archived': 3})
+
+
 class NonClearingSearchBackendMixinTestMixin(SearchBackendTestMixin):
     """ Test class mixin for testing children of NonClearingSearchBackendMixin. """
 
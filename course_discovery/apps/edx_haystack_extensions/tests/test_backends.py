@@ -1,13 +1,17 @@
 import haystack
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
-from course_discovery.apps.edx_haystack_extensions.backends import EdxElasticsearchSearchBackend
+from course_discovery.apps.edx_haystack_extensions.backends import (
+    EdxElasticsearchSearchBackend, EdxElasticsearchSearchQuery
+)
 from course_discovery.apps.edx_haystack_extensions.tests.mixins import (
-    NonClearingSearchBackendMixinTestMixin, SimpleQuerySearchBackendMixinTestMixin
+    FilterQueryFacetSearchBackendMixinTestMixin, NonClearingSearchBackendMixinTestMixin,
+    SimpleQuerySearchBackendMixinTestMixin
 )
 
 
-class EdxElasticsearchSearchBackendTests(NonClearingSearchBackendMixinTestMixin, SimpleQuerySearchBackendMixinTestMixin,
+class EdxElasticsearchSearchBackendTests(FilterQueryFacetSearchBackendMixinTestMixin,
+                                         NonClearingSearchBackendMixinTestMixin, SimpleQuerySearchBackendMixinTestMixin,
                                          TestCase):
     """ Tests for EdxElasticsearchSearchBackend.  """
     backend_class = EdxElasticsearchSearchBackend
@@ -21,3 +25,27 @@ class EdxElasticsearchSearchBackendTests(NonClearingSearchBackendMixinTestMixin,
         assert mapping.get('aggregation_key')
         assert mapping['aggregation_key']['index'] == 'not_analyzed'
         assert 'analyzer' not in mapping['aggregation_key']
+
+    @override_settings(DEBUG=True)
+    def test_source_filtered_search_is_logged(self):
+        """ Verify searches restricted to some source fields are added to Haystack's query log, like other searches. """
+        queries = haystack.connections[self.backend.connection_alias].queries
+        query_count = len(queries)
+
+        self.backend.search('test', source_fields=['title'])
+        assert len(queries) == query_count + 1
+        assert queries[-1]['query_string'] == 'test'
+
+
+class EdxElasticsearchSearchQueryTests(TestCase):
+    """ Tests for EdxElasticsearchSearchQuery. """
+
+    def test_source_fields(self):
+        """ Verify source fields are passed to the backend and preserved when the query is cloned. """
+        query = EdxElasticsearchSearchQuery()
+        assert 'source_fields' not in query.build_params()
+
+        query.set_source_fields(('title', 'key'))
+        clone = query._clone()  # pylint: disable=protected-access
+        assert clone.source_fields == ['title', 'key']
+        assert clone.build_params()['source_fields'] == ['title', 'key']
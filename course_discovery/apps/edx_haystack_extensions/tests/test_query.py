@@ -0,0 +1,15 @@
+import pytest
+
+from course_discovery.apps.edx_haystack_extensions.query import SourceFilteringSearchQuerySet
+
+
+@pytest.mark.usefixtures('haystack_default_connection')
+class TestSourceFilteringSearchQuerySet:
+    def test_source_fields(self):
+        """ Verify source_fields returns a clone that requests the given fields, leaving the original unchanged. """
+        queryset = SourceFilteringSearchQuerySet()
+        filtered_queryset = queryset.source_fields('title', 'key')
+
+        assert isinstance(filtered_queryset, SourceFilteringSearchQuerySet)
+        assert filtered_queryset.query.build_params()['source_fields'] == ['title', 'key']
+        assert 'source_fields' not in queryset.query.build_params()